@@ -8,21 +8,52 @@
 
 ### Imports ###
 import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, WatchedFileHandler
+import queue
 import smtplib
 from email.mime.text import MIMEText
 from email.utils import make_msgid
 import socket
+import shutil
 import signal
+import struct
 import sys
 import subprocess
 import time
 
+# Optional dependencies, fall back to the standard library if not installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+try:
+    import dns.asyncresolver
+    import dns.exception
+    import dns.resolver
+except ImportError:
+    dns = None
+
 ### Constants
 SCRIPT_VERSION = "1.0.0"
 SUBJECT_PREFIX = "[pi-peer-healthcheck ALERT]: "
-EMAIL_FROM = f"pi-peer-healthcheck@{socket.gethostname()}.kevind.link"
+_HOST = socket.gethostname()
+EMAIL_FROM = f"pi-peer-healthcheck@{_HOST}.kevind.link"
+MSGID_DOMAIN = f"{_HOST}.kevind.link"
+MAX_WORKERS = 32
+DNS_CACHE_TTL = 300
+DNS_NEGATIVE_CACHE_TTL = 60
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+
+# Resolved IP addresses keyed by hostname, values are (ip_address, expiry)
+_DNS_CACHE = {}
+
+# Shared ICMP socket for the life of the process, see get_icmp_pinger()
+_ICMP_PINGER = None
 
 ### Classes ###
 class PiPeer:
@@ -30,48 +61,147 @@ class PiPeer:
     Class representing a Raspberry Pi peer in the network.
     """
 
-    def __init__(self, hostname):
+    def __init__(self, hostname, dns_cache_ttl=DNS_CACHE_TTL):
         self.hostname = hostname
         self.status = "unknown"
+        self.dns_cache_ttl = dns_cache_ttl
+
+        # Command argument lists are built once and reused until the timeout or IP changes
+        self._ping_command = (None, None)
+        self._dns_command = (None, None)
 
-        self.ip_address = self.resolve_ip()
-        if self.ip_address is None:
+        self.ip_address = None
+        if self.resolve_ip() is None:
             raise ValueError(f"Could not resolve hostname for peer: {hostname}")
     
     def resolve_ip(self):
         """
         Resolve the IP address of the peer from its hostname.
+        On success the address is stored on the peer, a failed lookup keeps the last known address.
+        """
+        ip_address = resolve_hostname(self.hostname, self.dns_cache_ttl)
+        if ip_address is not None:
+            self.ip_address = ip_address
+        return ip_address
+
+    async def resolve_ip_async(self):
+        """
+        Resolve the IP address of the peer from its hostname without blocking the event loop.
+        """
+        ip_address = await resolve_hostname_async(self.hostname, self.dns_cache_ttl)
+        if ip_address is not None:
+            self.ip_address = ip_address
+        return ip_address
+    
+    def ping_command(self, timeout):
+        """
+        Get the argument list for pinging the peer.
+        """
+        key = (timeout, self.ip_address)
+        if self._ping_command[0] != key:
+            self._ping_command = (key, ["ping", "-c", "1", "-W", str(timeout), self.ip_address])
+        return self._ping_command[1]
+
+    def dns_command(self):
+        """
+        Get the argument list for querying the peer's DNS server.
+        """
+        if self._dns_command[0] != self.ip_address:
+            self._dns_command = (self.ip_address, ["nslookup", self.hostname, self.ip_address])
+        return self._dns_command[1]
+
+    async def peer_ping_async(self, timeout=5):
+        """
+        Perform a ping to the peer without blocking the event loop.
+        Uses the shared ICMP socket for IPv4 peers if available, otherwise runs the ping command as an asyncio subprocess.
+        """
+        pinger = get_icmp_pinger()
+        if pinger is not None and ":" not in self.ip_address:
+            if await pinger.ping(self.ip_address, timeout):
+                self.status = "healthy"
+                return True
+            self.status = "unhealthy"
+            return False
+
+        return await self.run_command_async(self.ping_command(timeout))
+
+    @staticmethod
+    async def batch_ping_async(peers, timeout=5):
+        """
+        Ping many peers at once with a single fping invocation.
+        Return:
+            dict: Ping success keyed by peer IP address, or None if fping could not be run
         """
         try:
-            return socket.gethostbyname(self.hostname)
-            self.status = "healthy"
+            proc = await asyncio.create_subprocess_exec("fping", "-q", "-c", "1", "-t", str(timeout * 1000),
+                                                        *{peer.ip_address for peer in peers},
+                                                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            _, stderr = await proc.communicate()
         except Exception:
             return None
-    
-    def peer_ping(self, timeout=5):
+
+        # fping exits 1 when some hosts are unreachable, anything higher means the sweep itself failed
+        if proc.returncode > 1:
+            return None
+
+        # Summary lines look like "host : xmt/rcv/%loss = 1/1/0%"
+        results = {}
+        for line in stderr.decode(errors="replace").splitlines():
+            host, sep, stats = line.partition(" : ")
+            if not sep or "=" not in stats:
+                continue
+            try:
+                _, received, _ = stats.split("=")[1].strip().split(",")[0].split("/")
+                results[host.strip()] = int(received) > 0
+            except ValueError:
+                continue
+        return results or None
+
+    def dns_resolver(self, timeout):
         """
-        Perform a ping to the peer to check its health.
+        Build a dnspython asyncio resolver that only queries the peer.
+        No answer cache is configured, every check must reach the peer itself.
         """
+        resolver = dns.asyncresolver.Resolver(configure=False)
+        resolver.nameservers = [self.ip_address]
+        resolver.timeout = timeout
+        resolver.lifetime = timeout
+        return resolver
+
+    async def test_dns_async(self, timeout=5):
+        """
+        Test that the peer is responding to DNS queries without blocking the event loop.
+        """
+        if dns is None:
+            return await self.run_command_async(self.dns_command(), timeout)
+
         try:
-            ping_command = f"ping -c 4 -W {timeout} {self.ip_address}"
-            ping_result = subprocess.run(ping_command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            if ping_result.returncode != 0:
-                self.status = "unhealthy"
-                return False
+            try:
+                await self.dns_resolver(timeout).resolve(self.hostname, "A")
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                # The peer answered, it just has no A record for the name
+                pass
             self.status = "healthy"
             return True
-        except Exception:
+        except dns.exception.DNSException:
             self.status = "unhealthy"
             return False
-    
-    def test_dns(self, timeout=5):
+
+    async def run_command_async(self, command, timeout=None):
         """
-        Test that the peer is responding to DNS queries.
+        Run a healthcheck command as an asyncio subprocess and set status from its return code.
+        The command is killed and treated as failed if it runs longer than timeout seconds.
         """
         try:
-            dns_command = f"timeout {timeout} nslookup {self.hostname} {self.ip_address}"
-            dns_result = subprocess.run(dns_command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            if dns_result.returncode != 0:
+            proc = await asyncio.create_subprocess_exec(*command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            try:
+                await asyncio.wait_for(proc.wait(), timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                self.status = "unhealthy"
+                return False
+            if proc.returncode != 0:
                 self.status = "unhealthy"
                 return False
             self.status = "healthy"
@@ -80,15 +210,245 @@ class PiPeer:
             self.status = "unhealthy"
             return False
 
+class ICMPPinger:
+    """
+    Class sending ICMP echo requests for all peers over one long-lived unprivileged ICMP socket.
+    Requires the process's group to be allowed by the net.ipv4.ping_group_range sysctl.
+    """
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+        self.sock.setblocking(False)
+        self._sequence = 0
+        # Futures waiting on a reply, keyed by (ip_address, sequence)
+        self._pending = {}
+        self._loop = None
+        # Echo identifier the kernel assigns to the socket, known once the first request is sent
+        self._identifier = None
+
+    async def ping(self, ip_address, timeout=5):
+        """
+        Send a single echo request and wait up to timeout seconds for the reply.
+        Return:
+            bool: True if the peer replied
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            loop.add_reader(self.sock.fileno(), self._read_replies)
+            self._loop = loop
+
+        self._sequence = (self._sequence + 1) & 0xFFFF
+        key = (ip_address, self._sequence)
+        reply = loop.create_future()
+        self._pending[key] = reply
+        try:
+            # The kernel fills in the identifier and checksum for ICMP datagram sockets
+            packet = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, 0, self._sequence) + b"pi-peer-healthcheck"
+            self.sock.sendto(packet, (ip_address, 0))
+            if self._identifier is None:
+                self._identifier = self.sock.getsockname()[1]
+            await asyncio.wait_for(reply, timeout)
+            return True
+        except (asyncio.TimeoutError, OSError):
+            return False
+        finally:
+            self._pending.pop(key, None)
+
+    def _read_replies(self):
+        """
+        Drain the socket, resolving the futures of any pending pings that were answered.
+        """
+        while True:
+            try:
+                data, address = self.sock.recvfrom(1024)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                # Errors such as ICMP unreachable are left for the ping timeout to report
+                continue
+
+            # Datagram ICMP sockets receive the ICMP message without its IP header
+            if len(data) < 8:
+                continue
+            icmp_type, _, _, identifier, sequence = struct.unpack("!BBHHH", data[:8])
+            if icmp_type != ICMP_ECHO_REPLY or identifier != self._identifier:
+                continue
+            reply = self._pending.get((address[0], sequence))
+            if reply is not None and not reply.done():
+                reply.set_result(True)
+
+class SMTPSession:
+    """
+    Class representing a reusable connection to an SMTP server.
+    The connection is opened on first use and reopened if the server drops it.
+    """
+
+    def __init__(self, smtp_server, email_from=EMAIL_FROM):
+        self.smtp_server = smtp_server
+        self.email_from = email_from
+        self._smtp_server_instance = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def connect(self):
+        """
+        Open a new connection to the SMTP server.
+        """
+        self.close()
+        self._smtp_server_instance = smtplib.SMTP(self.smtp_server)
+
+    def send(self, msg):
+        """
+        Send a message over the session, reconnecting once if the connection was lost.
+        """
+        if self._smtp_server_instance is None:
+            self.connect()
+        try:
+            self._smtp_server_instance.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            self.connect()
+            self._smtp_server_instance.send_message(msg)
+
+    def close(self):
+        """
+        Close the connection to the SMTP server if one is open.
+        """
+        if self._smtp_server_instance is None:
+            return
+        try:
+            self._smtp_server_instance.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp_server_instance.close()
+        self._smtp_server_instance = None
+
 ### Functions ###
+def get_icmp_pinger():
+    """
+    Get the shared ICMP pinger, opening its socket on first use
+    Return:
+        ICMPPinger: The shared pinger, or None if unprivileged ICMP sockets are not permitted
+    """
+
+    global _ICMP_PINGER
+    if _ICMP_PINGER is None:
+        try:
+            _ICMP_PINGER = ICMPPinger()
+        except OSError:
+            _ICMP_PINGER = False
+    return _ICMP_PINGER or None
+
+def cached_ip(hostname):
+    """
+    Look up a hostname in the DNS cache
+    Return:
+        tuple: Whether a fresh entry was found, and the cached IP address (None for a failed lookup)
+    """
+
+    cached = _DNS_CACHE.get(hostname)
+    if cached is not None and cached[1] > time.monotonic():
+        return True, cached[0]
+    return False, None
+
+def cache_ip(hostname, ip_address, ttl=DNS_CACHE_TTL):
+    """
+    Store a lookup result in the DNS cache.
+    Failed lookups are cached for a shorter time so they are retried sooner.
+    """
+
+    if ip_address is None:
+        ttl = min(ttl, DNS_NEGATIVE_CACHE_TTL)
+    _DNS_CACHE[hostname] = (ip_address, time.monotonic() + ttl)
+
+def resolve_hostname(hostname, ttl=DNS_CACHE_TTL):
+    """
+    Resolve a hostname to an IPv4 or IPv6 address, caching the result for ttl seconds
+    Return:
+        str: The resolved IP address, or None if it could not be resolved
+    """
+
+    found, ip_address = cached_ip(hostname)
+    if found:
+        return ip_address
+
+    try:
+        ip_address = socket.getaddrinfo(hostname, None, type=socket.SOCK_DGRAM)[0][4][0]
+    except (OSError, UnicodeError):
+        # Malformed names such as "a..b" fail IDNA encoding with UnicodeError rather than gaierror
+        ip_address = None
+    cache_ip(hostname, ip_address, ttl)
+
+    return ip_address
+
+async def resolve_hostname_async(hostname, ttl=DNS_CACHE_TTL):
+    """
+    Resolve a hostname like resolve_hostname() without blocking the event loop
+    Return:
+        str: The resolved IP address, or None if it could not be resolved
+    """
+
+    found, ip_address = cached_ip(hostname)
+    if found:
+        return ip_address
+
+    try:
+        addrinfo = await asyncio.get_running_loop().getaddrinfo(hostname, None, type=socket.SOCK_DGRAM)
+        ip_address = addrinfo[0][4][0]
+    except (OSError, UnicodeError):
+        # Malformed names such as "a..b" fail IDNA encoding with UnicodeError rather than gaierror
+        ip_address = None
+    cache_ip(hostname, ip_address, ttl)
+
+    return ip_address
+
+async def prime_dns_cache(hostnames, ttl=DNS_CACHE_TTL):
+    """
+    Resolve a list of hostnames concurrently, populating the DNS cache
+    """
+    await asyncio.gather(*[resolve_hostname_async(hostname, ttl) for hostname in hostnames])
+
+def invalidate_hostname(hostname):
+    """
+    Remove a hostname from the DNS cache so it is resolved again on next use
+    """
+    _DNS_CACHE.pop(hostname, None)
+
 def interrupt_handler(signum, frame):
     """
     Handle interrupt signals for graceful shutdown
     """
-    logger.info(f"Received interrupt signal ({signum}). Shutting down pi-peer-healthcheck ... ")
-    logging.shutdown()
+    logger.info("Received interrupt signal (%s). Shutting down pi-peer-healthcheck ... ", signum)
+    # Logging is flushed and shut down as the exit unwinds through the main block
     sys.exit(signum)
 
+def setup_logging(argDict):
+    """
+    Configure the root logger to queue records for a background thread,
+    which writes them to the logfile and console off the healthcheck path
+    Return:
+        QueueListener: The started listener, stop it on shutdown to flush queued records
+    """
+
+    # The logfile is only opened on first write, and one formatter is shared by both handlers.
+    # Rotation is left to logrotate, the handler reopens the logfile once it has been rotated away.
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [WatchedFileHandler(argDict["logfile"], delay=True), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers)
+
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG if argDict["verbose"] else logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+
+    listener.start()
+    return listener
+
 def get_args():
     """
     Parse command line arguments
@@ -137,6 +497,11 @@ def get_args():
                         default="mail.protonmail.ch",
                         help="SMTP server for sending email alerts (default: mail.protonmail.ch)",
                         required=False)
+    parser.add_argument("--dns-cache-ttl",
+                        type=int,
+                        default=DNS_CACHE_TTL,
+                        help=f"Seconds to cache resolved peer IP addresses (default: {DNS_CACHE_TTL})",
+                        required=False)
     parser.add_argument("--logfile",
                         type=str,
                         default="/var/log/pi-peer-healthcheck.log",
@@ -154,116 +519,219 @@ def get_args():
         "email": parsedArgs.email,
         "interval": parsedArgs.interval,
         "smtp_server": parsedArgs.smtp_server,
+        "dns_cache_ttl": parsedArgs.dns_cache_ttl,
         "logfile": parsedArgs.logfile
     }
 
-def send_email(email_address, smtp_server, subject, body):
+def send_email(session, email_address, subject, body):
     """
     Send email alert
     """
 
     msg = MIMEText(body)
     msg['Subject'] = subject
-    msg['From'] = EMAIL_FROM
+    msg['From'] = session.email_from
     msg['To'] = email_address
-    msg['Message-ID'] = make_msgid()
+    msg['Message-ID'] = make_msgid(domain=MSGID_DOMAIN)
 
     try:
-        with smtplib.SMTP(smtp_server) as server:
-            server.sendmail(msg['From'], [msg['To']], msg.as_string())
+        session.send(msg)
     except Exception as e:
         raise RuntimeError(f"Failed to send email to {email_address}: {e}")
     
-    return msg.as_string()
+    return msg
 
-def run(argDict, logger):
+async def ping_from_sweep(peer, ping_sweep, timeout):
     """
-    Main function
+    Get the ping result for a peer from a batch ping task, pinging it directly if the sweep failed
     """
 
-    logger.info("Initializing pi-peer-healthcheck ... ")
+    results = await ping_sweep
+    if results is None:
+        return await peer.peer_ping_async(timeout)
+    return results.get(peer.ip_address, False)
+
+async def check_peer(peer, argDict, logger, ping_sweep=None):
+    """
+    Run all healthchecks on a single peer
+    If ping_sweep is given, ping results are taken from that batch ping task instead of pinging the peer directly
+    Return:
+        tuple: The peer and the reason it is unhealthy (None if healthy)
+    """
+
+    reason = None
+    logger.info("Running healthchecks on peer: %s (%s)", peer.hostname, peer.ip_address)
+
+    # Ping the peer and, if enabled, test that it responds to DNS queries concurrently
+    logger.debug("Pinging peer: %s at IP %s", peer.hostname, peer.ip_address)
+    checks = [ping_from_sweep(peer, ping_sweep, argDict["timeout"]) if ping_sweep else peer.peer_ping_async(argDict["timeout"])]
+    if argDict["dnscheck"]:
+        logger.debug("Testing that peer is responding to DNS queries: %s", peer.hostname)
+        checks.append(peer.test_dns_async(argDict["timeout"]))
+    results = await asyncio.gather(*checks, return_exceptions=True)
+    ping_success = results[0] is True
+    dns_success = results[1] is True if argDict["dnscheck"] else True
+
+    # Ensure peer can be pinged
+    if not ping_success:
+        logger.error("Peer %s is NOT responding to pings!", peer.hostname)
+
+        # The IP may be stale, resolve it again so the next cycle checks the current address
+        logger.debug("Attempting to resolve IP for peer: %s", peer.hostname)
+        invalidate_hostname(peer.hostname)
+        resolved_ip = await peer.resolve_ip_async()
+        if resolved_ip is None:
+            logger.error("Could not resolve IP for peer: %s", peer.hostname)
+            reason = "Hostname cannot be resolved"
+        else:
+            logger.debug("Successfully resolved IP for peer %s: %s", peer.hostname, resolved_ip)
+            reason = "Host cannot be pinged"
+    else:
+        logger.debug("Peer %s responded successfully to pings.", peer.hostname)
+
+    # Ensure peer responds to DNS queries if enabled
+    if argDict["dnscheck"]:
+        if not dns_success:
+            logger.error("Peer %s is NOT responding to DNS queries!", peer.hostname)
+            reason = "Host not responding to DNS queries"
+        else:
+            logger.debug("Peer %s responded successfully to DNS queries.", peer.hostname)
+
+    # Both checks ran at once, so derive the status from their combined results
+    peer.status = "healthy" if ping_success and dns_success else "unhealthy"
+    logger.info("Peer %s is %s.", peer.hostname, peer.status)
+
+    return peer, reason
 
-    # Create PiPeer objects for each peer
-    peerList = []
-    for peer in argDict["peerList"]:
+def send_alert(session, email_address, subject, failures, logger):
+    """
+    Send a single alert email covering every failed peer
+    failures maps each peer name to the line describing why it failed
+    """
+
+    peers = ", ".join(failures)
+    logger.info("Sending alert email for peers: %s", peers)
+    body = "\n".join(failures.values()) + "\n\nPlease investigate the issue."
+    try:
+        msg = send_email(session, email_address, SUBJECT_PREFIX + subject, body)
+        logger.info("Successfully sent alert email to %s regarding peers: %s", email_address, peers)
+        logger.debug("Sent email content:\n %s", msg)
+    except Exception as e:
+        logger.error("Failed to send alert email for peers %s: %s", peers, e)
+
+async def run_cycle(peerList, argDict, logger):
+    """
+    Run healthchecks on all peers concurrently, then send one alert email for all unhealthy peers
+    """
+
+    # Without the shared ICMP socket, ping all peers with a single fping sweep when available
+    ping_sweep = None
+    if get_icmp_pinger() is None and shutil.which("fping"):
+        ping_sweep = asyncio.create_task(PiPeer.batch_ping_async(peerList, argDict["timeout"]))
+
+    failures = {}
+    tasks = [asyncio.create_task(check_peer(peer, argDict, logger, ping_sweep)) for peer in peerList]
+    for task in asyncio.as_completed(tasks):
+        peer, reason = await task
+        if peer.status == "unhealthy":
+            failures[peer.hostname] = f"Healthcheck for peer {peer.hostname} ({peer.ip_address}) failed due to: {reason}."
+        logger.info("Healthcheck completed for peer: %s", peer.hostname)
+
+    # Send email if any peer is unhealthy, one digest avoids an SMTP session per peer
+    if failures and argDict["email"]:
+        if len(failures) == 1:
+            subject = f"Raspberry Pi Peer {next(iter(failures))} is UNHEALTHY!"
+        else:
+            subject = f"{len(failures)} Raspberry Pi Peers are UNHEALTHY!"
+        # Sending email blocks, keep it off the event loop
+        session = SMTPSession(argDict["smtp_server"])
         try:
-            newPi = PiPeer(peer)
-            peerList.append(newPi)
-            logger.debug(f"Successfully create PiPeer object for {peer} with IP {newPi.ip_address}.")
-            logger.debug(f"PiPeer object details: {newPi.__dict__}")
-        except Exception as e:
-            logger.warning(f"Error creating PiPeer object for {peer}: {e}")
-            logger.warning(f"Peer {peer} will NOT be checked!")
-            if argDict["email"]:
-                logger.info(f"Sending alert email for failed PiPeer initialization: {peer}")
-                try:
-                    msg = send_email(argDict["email"], argDict["smtp_server"],
-                                        SUBJECT_PREFIX + f"Raspberry Pi Peer {peer} could not be initialized!",
-                                        f"Healthcheck for peer {peer} could not be initialized due to: {e}.\n\nPlease investigate the issue.")
-                    logger.info(f"Successfully sent alert email to {argDict['email']} regarding peer {peer.hostname}.")
-                    logger.debug(f"Sent email content:\n {msg}")
-                except Exception as e:
-                    logger.error(f"Failed to send alert email for peer {peer}: {e}")
-            continue
-    
-    # Main healthcheck loop, will exit after one iteration if not daemonized
+            await asyncio.to_thread(send_alert, session, argDict["email"], subject, failures, logger)
+        finally:
+            await asyncio.to_thread(session.close)
+
+async def refresh_peer_ips(peerList):
+    """
+    Resolve peers whose cached IP addresses have expired, keeping the last known address on failure
+    """
+    await asyncio.gather(*[peer.resolve_ip_async() for peer in peerList])
+
+async def run_forever(peerList, argDict, logger):
+    """
+    Run healthcheck cycles, sleeping between them when daemonized
+    """
+
     while True:
         logger.debug("Running healthchecks on peers ... ")
-        for peer in peerList:
-            logger.info(f"Running healthchecks on peer: {peer.hostname} ({peer.ip_address})")
-
-            # Ensure IP can be resolved
-            logger.debug(f"Attempting to resolve IP for peer: {peer.hostname}")
-            resolved_ip = peer.resolve_ip()
-            if resolved_ip is None:
-                logger.error(f"Could not resolve IP for peer: {peer.hostname}")
-                reason = "Hostname cannot be resolved"
-            else:
-                logger.debug(f"Successfully resolved IP for peer {peer.hostname}: {resolved_ip}")
-            
-            # Ensure peer can be pinged
-            logger.debug(f"Pinging peer: {peer.hostname} at IP {peer.ip_address}")
-            ping_success = peer.peer_ping(argDict["timeout"])
-            if not ping_success:
-                logger.error(f"Peer {peer.hostname} is NOT responding to pings!")
-                reason = "Host cannot be pinged"
-            else:
-                logger.debug(f"Peer {peer.hostname} responded successfully to pings.")
-
-            logger.info(f"Peer {peer.hostname} is {peer.status}.")
-
-            # Ensure peer responds to DNS queries if enabled
-            if argDict["dnscheck"]:
-                logger.debug(f"Testing that peer is responding to DNS queries: {peer.hostname}")
-                dns_success = peer.test_dns(argDict["timeout"])
-                if not dns_success:
-                    logger.error(f"Peer {peer.hostname} is NOT responding to DNS queries!")
-                    reason = "Host not responding to DNS queries"
-                else:
-                    logger.debug(f"Peer {peer.hostname} responded successfully to DNS queries.")
-
-            # Send email if unhealthy
-            if peer.status == "unhealthy" and argDict["email"]:
-                logger.info(f"Sending alert email for unhealthy peer: {peer.hostname}")
-                subject = SUBJECT_PREFIX + f"Raspberry Pi Peer {peer.hostname} is UNHEALTHY!"
-                body = f"Healthcheck for peer {peer.hostname} ({peer.ip_address}) failed due to: {reason}.\n\nPlease investigate the issue."
-                try:
-                    msg = send_email(argDict["email"], argDict["smtp_server"], subject, body)
-                    logger.info(f"Successfully sent alert email to {argDict['email']} regarding peer {peer.hostname}.")
-                    logger.debug(f"Sent email content:\n {msg}")
-                except Exception as e:
-                    logger.error(f"Failed to send alert email for peer {peer.hostname}: {e}")
-                
-            logger.info(f"Healthcheck completed for peer: {peer.hostname}")
+        await run_cycle(peerList, argDict, logger)
 
         logger.info("Healthchecks completed for all peers.")
-        logging.debug("Status for all peers: %s", {peer.hostname: peer.status for peer in peerList})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Status for all peers: %s", {peer.hostname: peer.status for peer in peerList})
 
         if not argDict["daemonize"]:
             break
-        else:
-            logger.info(f"Sleeping for {argDict['interval']} seconds before next healthcheck cycle ... ")
-            time.sleep(argDict["interval"])
+
+        logger.info("Sleeping for %s seconds before next healthcheck cycle ... ", argDict["interval"])
+        # Use the idle interval to refresh expired DNS cache entries ahead of the next cycle
+        refresh = asyncio.create_task(refresh_peer_ips(peerList))
+        await asyncio.sleep(argDict["interval"])
+        await refresh
+
+def new_event_loop():
+    """
+    Create the event loop for healthcheck cycles, preferring uvloop if installed.
+    The loop is passed to asyncio.Runner as a factory rather than through an event loop policy,
+    policies are deprecated from Python 3.14. The loop runs on the main thread only, worker
+    threads never drive their own loop.
+    """
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+def run(argDict, logger):
+    """
+    Main function
+    """
+
+    logger.info("Initializing pi-peer-healthcheck ... ")
+
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        # Blocking checks run in the loop's default executor, size it to the number of peers
+        loop = runner.get_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(argDict["peerList"])))))
+        logger.debug("Using event loop: %s.%s", type(loop).__module__, type(loop).__qualname__)
+
+        # Resolve all peers concurrently up front, PiPeer objects are then created from the cache
+        logger.debug("Resolving IP addresses for all peers ... ")
+        runner.run(prime_dns_cache(argDict["peerList"], argDict["dns_cache_ttl"]))
+
+        # Create PiPeer objects for each peer
+        peerList = []
+        failures = {}
+        for peer in argDict["peerList"]:
+            try:
+                newPi = PiPeer(peer, argDict["dns_cache_ttl"])
+                peerList.append(newPi)
+                logger.debug("Successfully create PiPeer object for %s with IP %s.", peer, newPi.ip_address)
+                logger.debug("PiPeer object details: %s", newPi.__dict__)
+            except Exception as e:
+                logger.warning("Error creating PiPeer object for %s: %s", peer, e)
+                logger.warning("Peer %s will NOT be checked!", peer)
+                failures[peer] = f"Healthcheck for peer {peer} could not be initialized due to: {e}."
+                continue
+
+        # Send one alert email for all peers that failed initialization
+        if failures and argDict["email"]:
+            if len(failures) == 1:
+                subject = f"Raspberry Pi Peer {next(iter(failures))} could not be initialized!"
+            else:
+                subject = f"{len(failures)} Raspberry Pi Peers could not be initialized!"
+            with SMTPSession(argDict["smtp_server"]) as session:
+                send_alert(session, argDict["email"], subject, failures, logger)
+
+        # Main healthcheck loop, will exit after one iteration if not daemonized
+        runner.run(run_forever(peerList, argDict, logger))
     
     sys.exit(0)
 
@@ -274,24 +742,26 @@ if __name__ == "__main__":
     argDict = get_args()
 
     # Initialize logger
-    logging.basicConfig(level=logging.DEBUG if argDict["verbose"] else logging.INFO,
-                        format='%(asctime)s - %(levelname)s - %(message)s',
-                        handlers=[logging.FileHandler(argDict["logfile"]),
-                                logging.StreamHandler()])
+    listener = setup_logging(argDict)
     logger = logging.getLogger()
 
     logger.debug("Verbose logging enabled.")
     logger.debug("Parsed arguments successfully: %s", argDict)
     
-    logger.debug("Setting up interrupt signal handlers ... ")
     try:
-        signal.signal(signal.SIGINT, interrupt_handler)
-        signal.signal(signal.SIGTERM, interrupt_handler)
-        signal.signal(signal.SIGQUIT, interrupt_handler)
-        logger.debug("Interrupt signal handlers set up successfully.")
-    except Exception as e:
-        logger.error(f"Failed to set up interrupt signal handlers: {e}")
-        sys.exit(1)
+        logger.debug("Setting up interrupt signal handlers ... ")
+        try:
+            signal.signal(signal.SIGINT, interrupt_handler)
+            signal.signal(signal.SIGTERM, interrupt_handler)
+            signal.signal(signal.SIGQUIT, interrupt_handler)
+            logger.debug("Interrupt signal handlers set up successfully.")
+        except Exception as e:
+            logger.error("Failed to set up interrupt signal handlers: %s", e)
+            sys.exit(1)
 
-    logger.debug("Starting main pi-peer-healthcheck run function ... ")
-    run(argDict, logger)
\ No newline at end of file
+        logger.debug("Starting main pi-peer-healthcheck run function ... ")
+        run(argDict, logger)
+    finally:
+        # Write out any queued log records before exiting
+        listener.stop()
+        logging.shutdown()